@@ -61,6 +61,7 @@ impl Stt for LocalSttStrategy {
                 diarization: options.diarization,
                 num_speakers,
                 initial_prompt: options.initial_prompt.unwrap_or_default(),
+                stream_batch_size: None,
             }),
         };
 
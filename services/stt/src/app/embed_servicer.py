@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 import grpc
@@ -23,7 +24,7 @@ class EmbeddingServicer(embeddings_pb2_grpc.EmbeddingServiceServicer):
     def __init__(self, settings: Settings):
         self._engine = EmbeddingsEngine(settings)
 
-    def CreateEmbeddings(self, request, context):
+    async def CreateEmbeddings(self, request, context):
         """
         Unpack the gRPC request and fetch vector embeddings from the domain engine.
         """
@@ -32,13 +33,13 @@ class EmbeddingServicer(embeddings_pb2_grpc.EmbeddingServiceServicer):
         truncate = request.truncate
 
         if not inputs:
-            context.abort(
+            await context.abort(
                 grpc.StatusCode.INVALID_ARGUMENT, "Inputs list cannot be empty."
             )
             return None
 
         if not model:
-            context.abort(
+            await context.abort(
                 grpc.StatusCode.INVALID_ARGUMENT, "Model identifier cannot be empty."
             )
             return None
@@ -48,7 +49,7 @@ class EmbeddingServicer(embeddings_pb2_grpc.EmbeddingServiceServicer):
         elif request.input_type == embeddings_pb2.INPUT_TYPE_QUERY:
             domain_input_type = DomainInputType.QUERY
         else:
-            context.abort(
+            await context.abort(
                 grpc.StatusCode.INVALID_ARGUMENT,
                 "input_type must be explicitly set to either DOCUMENT or QUERY.",
             )
@@ -59,7 +60,8 @@ class EmbeddingServicer(embeddings_pb2_grpc.EmbeddingServiceServicer):
         )
 
         try:
-            domain_response = self._engine.embed(
+            domain_response = await asyncio.to_thread(
+                self._engine.embed,
                 model=model,
                 inputs=inputs,
                 input_type=domain_input_type,
@@ -70,15 +72,17 @@ class EmbeddingServicer(embeddings_pb2_grpc.EmbeddingServiceServicer):
             return self._map_to_proto(domain_response)
 
         except ValueError as exc:
-            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(exc))
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(exc))
         except EmbeddingsError:
             logger.exception("Embedding generation failed")
-            context.abort(
+            await context.abort(
                 grpc.StatusCode.INTERNAL, "Failed to generate embeddings via provider."
             )
         except Exception:
             logger.exception("Unexpected error in EmbeddingsEngine")
-            context.abort(grpc.StatusCode.INTERNAL, "An unexpected error occurred.")
+            await context.abort(
+                grpc.StatusCode.INTERNAL, "An unexpected error occurred."
+            )
 
     @staticmethod
     def _map_to_proto(domain_response) -> embeddings_pb2.EmbeddingResponse:
@@ -1,15 +1,23 @@
 """
 Entry point for the AI gRPC Application.
 
-This script configures structured logging, initializes the gRPC server,
-registers the STT, Embedding, and Reranker services, and handles the service lifecycle.
+This script configures structured logging, initializes the asyncio gRPC
+server, registers the STT, Embedding, and Reranker services, and handles the
+service lifecycle.
 """
 
 import argparse
+import asyncio
+import atexit
+import copy
 import logging
+import multiprocessing
 import os
+import queue
 import signal
+import threading
 from concurrent import futures
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 import grpc
@@ -23,13 +31,43 @@ from src.app.embed_servicer import EmbeddingServicer
 from src.app.stt_servicer import SpeechToTextServicer
 from src.app.reranker_servicer import RerankerServicer
 
-from src.core.settings import load_settings
+from src.core.settings import (
+    Settings,
+    inference_workers,
+    load_settings,
+    print_summary,
+)
 
 logger = logging.getLogger(__name__)
 
+# Headroom on top of the audio payload for the rest of a request message
+_MESSAGE_OVERHEAD_BYTES = 1024 * 1024
+
+
+class _DeferredFormatQueueHandler(QueueHandler):
+    """
+    Queue handler that leaves JSON formatting to the listener thread.
+
+    The stock ``prepare`` renders the full message (traceback included) on
+    the calling thread. Here only the ``%``-args are merged, so request
+    threads pay for a record copy and a queue put, while ``exc_info`` and
+    ``extra`` fields still reach the JSON formatter intact.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
 
 def setup_logging():
-    """Configure the root logger to emit structured JSON logs."""
+    """
+    Configure the root logger to emit structured JSON logs.
+
+    Records are handed to a background listener thread through a lock-free
+    queue; formatting and the stream write happen off the RPC threads.
+    """
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.INFO)
 
@@ -37,21 +75,145 @@ def setup_logging():
         log_handler = logging.StreamHandler()
         formatter = JsonFormatter("%(asctime)s %(levelname)s %(name)s %(message)s")
         log_handler.setFormatter(formatter)
-        root_logger.addHandler(log_handler)
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, log_handler)
+        listener.start()
+        # Drain anything still queued before the interpreter exits
+        atexit.register(listener.stop)
+
+        root_logger.addHandler(_DeferredFormatQueueHandler(log_queue))
+
+
+def _server_options(settings: Settings) -> list[tuple[str, int]]:
+    """
+    gRPC channel arguments for the server.
+
+    The receive limit must admit the largest inline audio payload the
+    service accepts; gRPC's 4 MiB default would reject most uploads before
+    they reach the size check in AudioResolver.
+    """
+    max_message_bytes = (
+        settings.service.max_audio_size_mb * 1024 * 1024 + _MESSAGE_OVERHEAD_BYTES
+    )
+    return [
+        ("grpc.max_receive_message_length", max_message_bytes),
+        ("grpc.max_send_message_length", max_message_bytes),
+    ]
+
+
+def _start_pool(size: int, thread_name_prefix: str) -> futures.ThreadPoolExecutor:
+    """
+    Create a thread pool with every thread spawned up front, so the first
+    requests do not pay for thread creation.
+    """
+    pool = futures.ThreadPoolExecutor(
+        max_workers=size, thread_name_prefix=thread_name_prefix
+    )
+
+    # The executor reuses idle threads rather than spawning new ones; holding
+    # each task on a barrier forces all `size` threads into existence.
+    barrier = threading.Barrier(size)
+    futures.wait([pool.submit(barrier.wait) for _ in range(size)])
+
+    logger.info(
+        "Worker pool started", extra={"pool": thread_name_prefix, "threads": size}
+    )
+    return pool
 
 
 def serve(config_path: str):
     setup_logging()
     settings = load_settings(config_path)
+    print_summary(settings)
 
-    # 1. Initialize the core gRPC server
-    server = grpc.server(
-        futures.ThreadPoolExecutor(max_workers=settings.concurrency.max_workers)
+    num_processes = settings.concurrency.num_processes
+    if num_processes <= 1:
+        _serve_worker(settings, settings.service.socket_path)
+        return
+
+    _serve_multiprocess(settings, num_processes)
+
+
+def _serve_multiprocess(settings: Settings, num_processes: int):
+    """
+    Fan out *num_processes* independent server processes.
+
+    Each worker constructs its own models after start-up (``spawn`` context,
+    so no CUDA state is inherited from the parent) and binds its own socket.
+    Worker 0 serves ``socket_path`` itself, so existing clients keep working;
+    the others bind ``<socket_path>.<worker_id>``. Unix sockets cannot be
+    load-balanced by the kernel, so clients that want the extra capacity
+    spread requests across the sockets.
+    """
+    socket_path = settings.service.socket_path
+    ctx = multiprocessing.get_context("spawn")
+    workers = [
+        ctx.Process(
+            target=_serve_worker,
+            args=(settings, _worker_socket_path(socket_path, worker_id)),
+            name=f"stt-worker-{worker_id}",
+        )
+        for worker_id in range(num_processes)
+    ]
+    for worker in workers:
+        worker.start()
+
+    logger.info("Started worker processes", extra={"num_processes": num_processes})
+
+    def forward_shutdown(signum, frame):
+        logger.info(f"Received signal {signum}, stopping worker processes...")
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+
+    signal.signal(signal.SIGTERM, forward_shutdown)
+    signal.signal(signal.SIGINT, forward_shutdown)
+
+    for worker in workers:
+        worker.join()
+
+    logger.info("All worker processes exited.")
+
+
+def _worker_socket_path(socket_path: str, worker_id: int) -> str:
+    """Socket for *worker_id*: the configured path for worker 0, else suffixed."""
+    if worker_id == 0:
+        return socket_path
+    return f"{socket_path}.{worker_id}"
+
+
+def _serve_worker(settings: Settings, socket_path: str):
+    """Build, bind and run a single gRPC server on *socket_path*."""
+    setup_logging()
+    asyncio.run(_run_server(settings, socket_path))
+
+
+async def _run_server(settings: Settings, socket_path: str):
+    # Blocking I/O (downloads, provider calls) is offloaded by the servicers
+    # via asyncio.to_thread onto the loop's default executor
+    loop = asyncio.get_running_loop()
+    concurrency = settings.concurrency
+    loop.set_default_executor(_start_pool(concurrency.max_workers, "grpc-worker"))
+
+    # Whisper inference gets its own pool, capped on CPU so that its threads
+    # times CTranslate2's cpu_threads do not oversubscribe the cores
+    inference_pool = _start_pool(
+        inference_workers(
+            concurrency.max_workers,
+            concurrency.cpu_threads,
+            concurrency.num_processes,
+            settings.model.device,
+        ),
+        "inference",
     )
 
+    # 1. Initialize the core gRPC server
+    server = grpc.aio.server(options=_server_options(settings))
+
     # 2. Register Services
     speech_pb2_grpc.add_SpeechToTextServicer_to_server(
-        SpeechToTextServicer(settings), server
+        SpeechToTextServicer(settings, inference_pool), server
     )
     embeddings_pb2_grpc.add_EmbeddingServiceServicer_to_server(
         EmbeddingServicer(settings), server
@@ -62,54 +224,58 @@ def serve(config_path: str):
     )
 
     # 3. Network Binding Logic
-    if settings.service.is_unix_socket:
-        socket_path = settings.service.socket_path
-        assert socket_path is not None, "Socket path must be provided for Unix sockets"
+    # Ensure the parent directory exists
+    os.makedirs(os.path.dirname(socket_path), exist_ok=True)
 
-        # Ensure the parent directory exists
-        os.makedirs(os.path.dirname(socket_path), exist_ok=True)
+    # Bind to a private path first and atomically move it into place once it
+    # is live, so a restarting instance never unlinks a socket another
+    # process is still serving from.
+    staging_path = f"{socket_path}.{os.getpid()}.new"
+    try:
+        os.unlink(staging_path)
+    except FileNotFoundError:
+        pass
 
-        # Clean up stale socket file if it crashed previously
-        if os.path.exists(socket_path):
-            os.unlink(socket_path)
-
-        # gRPC explicitly requires the 'unix://' scheme for UDS
-        bind_address = f"unix://{socket_path}"
-        server.add_insecure_port(bind_address)
-    else:
-        # Standard TCP binding (e.g., "0.0.0.0:50051")
-        bind_address = settings.service.address
-        server.add_insecure_port(bind_address)
+    # gRPC explicitly requires the 'unix://' scheme for UDS
+    server.add_insecure_port(f"unix://{staging_path}")
 
     # 4. Start Server
-    server.start()
+    await server.start()
 
-    # Apply tight permissions to the UDS *after* server.start() creates the file
-    if settings.service.is_unix_socket:
-        os.chmod(settings.service.socket_path, 0o600)
+    # Apply tight permissions before the socket becomes reachable
+    os.chmod(staging_path, 0o600)
+    os.replace(staging_path, socket_path)
+    socket_inode = os.stat(socket_path).st_ino
 
+    bind_address = f"unix://{socket_path}"
     logger.info("Service started", extra={"address": bind_address})
 
-    # 5. Graceful Shutdown & Cleanup Handler
-    def handle_shutdown(signum, frame):
-        logger.info(f"Received signal {signum}, initiating graceful shutdown...")
-        # Allow 10 seconds for active RPCs to finish
-        stop_event = server.stop(grace=10)
-        stop_event.wait()
+    # 5. Block until SIGTERM/SIGINT
+    stop_signal: asyncio.Future[int] = loop.create_future()
+
+    def request_shutdown(signum: int):
+        if not stop_signal.done():
+            stop_signal.set_result(signum)
 
-        # Clean up the socket file gracefully on exit
-        if settings.service.is_unix_socket and os.path.exists(
-            settings.service.socket_path
-        ):
-            os.unlink(settings.service.socket_path)
+    loop.add_signal_handler(signal.SIGTERM, request_shutdown, signal.SIGTERM)
+    loop.add_signal_handler(signal.SIGINT, request_shutdown, signal.SIGINT)
 
-        logger.info("Shutdown complete.")
+    signum = await stop_signal
 
-    signal.signal(signal.SIGTERM, handle_shutdown)
-    signal.signal(signal.SIGINT, handle_shutdown)
+    # 6. Graceful Shutdown & Cleanup
+    logger.info(f"Received signal {signum}, initiating graceful shutdown...")
+    # Allow 10 seconds for active RPCs to finish
+    await server.stop(grace=10)
+    inference_pool.shutdown(wait=False, cancel_futures=True)
+
+    # Clean up the socket file on exit, unless a newer instance replaced it
+    try:
+        if os.stat(socket_path).st_ino == socket_inode:
+            os.unlink(socket_path)
+    except FileNotFoundError:
+        pass
 
-    # 6. Block main thread
-    server.wait_for_termination()
+    logger.info("Shutdown complete.")
 
 
 if __name__ == "__main__":
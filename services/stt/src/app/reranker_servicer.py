@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 import grpc
@@ -19,7 +20,7 @@ class RerankerServicer(reranker_pb2_grpc.RerankerServiceServicer):
     def __init__(self, settings: Settings):
         self._engine = RerankerEngine(settings)
 
-    def Rerank(self, request, context):
+    async def Rerank(self, request, context):
         """
         Unpack the gRPC request and fetch reranked documents from the domain engine.
         """
@@ -28,17 +29,19 @@ class RerankerServicer(reranker_pb2_grpc.RerankerServiceServicer):
         documents = list(request.documents)
 
         if not model or not model.strip():
-            context.abort(
+            await context.abort(
                 grpc.StatusCode.INVALID_ARGUMENT, "Model identifier cannot be empty."
             )
             return None
 
         if not query or not query.strip():
-            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Query cannot be empty.")
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT, "Query cannot be empty."
+            )
             return None
 
         if not documents or any(not doc.strip() for doc in documents):
-            context.abort(
+            await context.abort(
                 grpc.StatusCode.INVALID_ARGUMENT,
                 "Documents list cannot be empty or contain blank entries.",
             )
@@ -48,12 +51,13 @@ class RerankerServicer(reranker_pb2_grpc.RerankerServiceServicer):
         truncate = request.truncate if request.HasField("truncate") else None
 
         if top_k is not None and top_k <= 0:
-            context.abort(
+            await context.abort(
                 grpc.StatusCode.INVALID_ARGUMENT, "top_k must be greater than 0."
             )
 
         try:
-            domain_response = self._engine.rerank(
+            domain_response = await asyncio.to_thread(
+                self._engine.rerank,
                 model=model,
                 query=query,
                 documents=documents,
@@ -65,12 +69,14 @@ class RerankerServicer(reranker_pb2_grpc.RerankerServiceServicer):
 
         except RerankerError:
             logger.exception("Reranking generation failed")
-            context.abort(
+            await context.abort(
                 grpc.StatusCode.INTERNAL, "Failed to rerank documents via provider."
             )
         except Exception:
             logger.exception("Unexpected error in RerankerEngine")
-            context.abort(grpc.StatusCode.INTERNAL, "An unexpected error occurred.")
+            await context.abort(
+                grpc.StatusCode.INTERNAL, "An unexpected error occurred."
+            )
 
     @staticmethod
     def _map_to_proto(domain_response) -> reranker_pb2.RerankResponse:
@@ -1,4 +1,8 @@
+import asyncio
 import logging
+from concurrent.futures import Executor
+from urllib.parse import urlparse
+
 import grpc
 
 from src.generated.speech import speech_pb2_grpc, speech_pb2
@@ -16,26 +20,109 @@ from src.stt.engine import TranscriptionEngine, INFERENCE_ERRORS
 logger = logging.getLogger(__name__)
 
 
+def _loggable_source(log_source: str, source_type: str) -> str:
+    """
+    Reduce a ``uri`` source to its scheme and host for logging.
+
+    Paths and query strings of remote URIs can carry credentials (e.g.
+    pre-signed S3/GCS tokens), so they never reach the logs.
+    """
+    if source_type != "uri":
+        return log_source
+    parsed = urlparse(log_source)
+    return f"{parsed.scheme}://{parsed.hostname}"
+
+
 class SpeechToTextServicer(speech_pb2_grpc.SpeechToTextServicer):
     """
     gRPC Adapter for the Transcription Engine.
     Handles proto mapping, audio resolution, and network-level error handling.
     """
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, inference_executor: Executor | None = None):
         self._resolver = AudioResolver(
             max_bytes=settings.service.max_audio_size_mb * 1024 * 1024,
+            pool_size=settings.concurrency.max_workers,
         )
         self._engine = TranscriptionEngine(settings)
+        self._stream_batch_size = settings.service.stream_batch_size
+        # None falls back to the loop's default executor
+        self._inference_executor = inference_executor
+        # Transcriptions beyond the cap are rejected with RESOURCE_EXHAUSTED
+        # rather than queued, since each may hold a whole audio payload
+        self._admission = asyncio.Semaphore(settings.concurrency.max_concurrent_rpcs)
 
-    def Transcribe(self, request, context):
+    async def Transcribe(self, request, context):
         """
         Unpack the gRPC request, fetch the audio, and stream the engine's response.
         """
+        async for domain_chunk in self._transcribe_chunks(request, context):
+            message = speech_pb2.TranscriptChunk()
+            self._write_chunk(message, domain_chunk)
+            yield message
+
+    async def TranscribeBatched(self, request, context):
+        """
+        Like Transcribe, but coalesce consecutive chunks into batches.
+
+        Each batch holds up to ``options.stream_batch_size`` chunks (the
+        configured default when unset); a final partial batch is flushed
+        when the transcript ends.
+        """
+        options = request.options
+        batch_size = (
+            options.stream_batch_size
+            if options.HasField("stream_batch_size")
+            else self._stream_batch_size
+        )
+        batch_size = max(1, batch_size)
+
+        batch = speech_pb2.TranscriptChunkBatch()
+        async for domain_chunk in self._transcribe_chunks(request, context):
+            self._write_chunk(batch.chunks.add(), domain_chunk)
+            if len(batch.chunks) >= batch_size:
+                yield batch
+                batch = speech_pb2.TranscriptChunkBatch()
+
+        if batch.chunks:
+            yield batch
+
+    async def _transcribe_chunks(self, request, context):
+        """
+        Admit the request under the transcription concurrency cap, then
+        yield the engine's domain chunks for it.
+        """
+        if self._admission.locked():
+            await context.abort(
+                grpc.StatusCode.RESOURCE_EXHAUSTED,
+                "Too many concurrent transcriptions; retry later",
+            )
+            return
+
+        async with self._admission:
+            async for domain_chunk in self._run_transcription(request, context):
+                yield domain_chunk
+
+    async def _run_transcription(self, request, context):
+        """
+        Resolve the request's audio and yield the engine's domain chunks.
+
+        Audio resolution and each step of the engine's generator run on the
+        event loop's default executor, so the loop stays free to service
+        other streams while inference is in progress.
+        """
+        # Shielded so that a cancelled RPC does not orphan the worker thread's
+        # result: a download that completes afterwards is still cleaned up
+        resolving = asyncio.ensure_future(
+            asyncio.to_thread(self._resolver.resolve, request)
+        )
         try:
-            audio_data, log_source, source_type = self._resolver.resolve(request)
+            audio_data, log_source, source_type = await asyncio.shield(resolving)
+        except asyncio.CancelledError:
+            resolving.add_done_callback(self._cleanup_abandoned)
+            raise
         except (AudioValidationError, AudioFetchError) as exc:
-            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(exc))
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(exc))
             return
 
         options = request.options
@@ -44,6 +131,16 @@ class SpeechToTextServicer(speech_pb2_grpc.SpeechToTextServicer):
         language = request.language or None
         prompt = options.initial_prompt or None
 
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Transcription requested",
+                extra={
+                    "audio_source_type": source_type,
+                    "audio_source": _loggable_source(log_source, source_type),
+                    "diarize": diarize,
+                },
+            )
+
         try:
             chunk_generator = self._engine.transcribe(
                 audio_data=audio_data,
@@ -53,39 +150,60 @@ class SpeechToTextServicer(speech_pb2_grpc.SpeechToTextServicer):
                 initial_prompt=prompt,
             )
 
-            for domain_chunk in chunk_generator:
-                yield self._map_to_proto(domain_chunk)
+            loop = asyncio.get_running_loop()
+            while True:
+                domain_chunk = await loop.run_in_executor(
+                    self._inference_executor, next, chunk_generator, None
+                )
+                if domain_chunk is None:
+                    break
+                yield domain_chunk
 
         except ValueError as exc:
-            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(exc))
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(exc))
         except AudioDecodeError as exc:
-            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(exc))
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(exc))
         except INFERENCE_ERRORS:
             logger.exception("STT Engine failed")
-            context.abort(grpc.StatusCode.INTERNAL, "Transcription failed")
+            await context.abort(grpc.StatusCode.INTERNAL, "Transcription failed")
         except Exception:
             logger.exception("Unexpected error in STT Servicer")
-            context.abort(grpc.StatusCode.INTERNAL, "An unexpected error occurred.")
+            await context.abort(
+                grpc.StatusCode.INTERNAL, "An unexpected error occurred."
+            )
+        finally:
+            # Remove any temp file backing a downloaded URI, whether the RPC
+            # completed, failed, or was cancelled by the client.
+            self._resolver.cleanup(audio_data, source_type)
+
+    def _cleanup_abandoned(self, resolving: asyncio.Future) -> None:
+        """Release audio resolved for an RPC that was cancelled meanwhile."""
+        if resolving.cancelled() or resolving.exception() is not None:
+            return
+        audio_data, _, source_type = resolving.result()
+        self._resolver.cleanup(audio_data, source_type)
 
     @staticmethod
-    def _map_to_proto(chunk) -> speech_pb2.TranscriptChunk:
+    def _write_chunk(message: speech_pb2.TranscriptChunk, chunk) -> None:
         """
-        Maps the domain TranscriptChunkResult to the Protobuf message.
+        Maps the domain TranscriptChunkResult onto a Protobuf message.
+
+        The caller supplies the target message, so chunks can be written
+        directly into a batch's repeated field. Words are likewise
+        constructed in place rather than built standalone and copied in.
         """
-        return speech_pb2.TranscriptChunk(
-            start_time=chunk.start_time,
-            end_time=chunk.end_time,
-            text=chunk.text,
-            speaker_id=chunk.speaker_id,
-            confidence=chunk.confidence,
-            words=[
-                speech_pb2.Word(
-                    start_time=w.start_time,
-                    end_time=w.end_time,
-                    text=w.text,
-                    confidence=w.confidence,
-                    speaker_id=w.speaker_id,
-                )
-                for w in chunk.words
-            ],
-        )
+        message.start_time = chunk.start_time
+        message.end_time = chunk.end_time
+        message.text = chunk.text
+        message.speaker_id = chunk.speaker_id
+        message.confidence = chunk.confidence
+
+        add_word = message.words.add
+        for w in chunk.words:
+            add_word(
+                start_time=w.start_time,
+                end_time=w.end_time,
+                text=w.text,
+                confidence=w.confidence,
+                speaker_id=w.speaker_id,
+            )
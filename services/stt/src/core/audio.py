@@ -9,8 +9,13 @@ models (16 kHz mono float32 numpy arrays).
 import io
 import ipaddress
 import logging
+import os
 import socket
 import subprocess
+import tempfile
+import wave
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Callable
 from urllib.parse import urlparse
 
 import numpy as np
@@ -27,6 +32,9 @@ _ALLOWED_SCHEMES = {"http", "https"}
 # Maximum number of redirects we will follow (each hop is re-validated).
 _MAX_REDIRECTS = 5
 
+# Read size used when streaming remote audio to disk.
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class AudioValidationError(Exception):
     """Raised when audio input fails a validation check."""
@@ -124,22 +132,48 @@ class AudioResolver:
     Handles three audio source types:
       - ``path``:  local file path (passed through as-is)
       - ``data``:  inline bytes payload
-      - ``uri``:   remote URL (downloaded with size limits)
+      - ``uri``:   remote URL (streamed to a temp file with size limits)
+
+    Remote fetches share one ``requests.Session`` so keep-alive
+    connections to the same host are reused across requests. The
+    session never stores cookies, so no state leaks between requests.
 
     Parameters:
         max_bytes: Maximum allowed audio size in bytes.
+        pool_size: Number of concurrent connections kept per host;
+            should match the number of request handler threads.
     """
 
-    def __init__(self, max_bytes: int):
+    def __init__(self, max_bytes: int, pool_size: int = 1):
         self._max_bytes = max_bytes
 
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size * 2,
+        )
+        self._http = requests.Session()
+        # Share connections, not state: never store cookies from one fetch
+        # and send them with another caller's request to the same host
+        self._http.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
+
+        # One handler per ``audio_source`` oneof member
+        self._handlers: dict[str, Callable[[Any], tuple[str | bytes, str]]] = {
+            "path": self._from_path,
+            "data": self._from_data,
+            "uri": self._from_uri,
+        }
+
     def resolve(self, request) -> tuple[str | bytes, str, str]:
         """
         Extract audio content from a TranscribeRequest.
 
         Returns:
             tuple of (audio, log_source, source_type) where *audio* is
-            either a file-path ``str`` or raw ``bytes``.
+            either a file-path ``str`` or raw ``bytes``.  Remote URIs are
+            downloaded to a temporary file; release it with
+            :meth:`cleanup` once the request completes.
 
         Raises:
             AudioValidationError: If the payload exceeds size limits or
@@ -147,18 +181,27 @@ class AudioResolver:
             AudioFetchError: If a remote URI cannot be retrieved.
         """
         source_type = request.WhichOneof("audio_source")
+        handler = self._handlers.get(source_type)
+        if handler is None:
+            raise AudioValidationError("No valid audio_source provided")
 
-        if source_type == "path":
-            return request.path, request.path, source_type
+        audio, log_source = handler(request)
+        return audio, log_source, source_type
 
-        if source_type == "data":
-            self._check_size(len(request.data))
-            return bytes(request.data), "<bytes_payload>", source_type
+    @staticmethod
+    def _from_path(request) -> tuple[str, str]:
+        return request.path, request.path
 
-        if source_type == "uri":
-            return self._fetch_uri(request.uri), request.uri, source_type
+    def _from_data(self, request) -> tuple[bytes, str]:
+        # Read the field once: with the upb backend every access to a bytes
+        # field returns a fresh copy of the payload
+        data = request.data
+        self._check_size(len(data))
+        request.ClearField("data")
+        return data, "<bytes_payload>"
 
-        raise AudioValidationError("No valid audio_source provided")
+    def _from_uri(self, request) -> tuple[str, str]:
+        return self._fetch_uri(request.uri), request.uri
 
     def _check_size(self, size: int) -> None:
         if size > self._max_bytes:
@@ -166,11 +209,15 @@ class AudioResolver:
                 f"Audio data exceeds maximum size of {self._max_bytes} bytes"
             )
 
-    def _fetch_uri(self, uri: str) -> bytes:
+    def _fetch_uri(self, uri: str) -> str:
         """
         Download audio from a remote URI with SSRF protection and
         streaming size checks.
 
+        The body is streamed straight to a temporary file rather than
+        buffered in memory, and the file path is returned.  Callers own
+        the file and must release it with :meth:`cleanup`.
+
         The method:
         1. Validates the scheme (HTTP/HTTPS only) and resolved IPs of
            the initial URI *before* opening a connection.
@@ -189,7 +236,7 @@ class AudioResolver:
             for _redirect in range(_MAX_REDIRECTS + 1):
                 _validate_uri(current_uri)
 
-                response = requests.get(
+                response = self._http.get(
                     current_uri,
                     timeout=15,
                     stream=True,
@@ -198,6 +245,7 @@ class AudioResolver:
 
                 if response.is_redirect or response.is_permanent_redirect:
                     redirect_target = response.headers.get("Location")
+                    response.close()
                     if not redirect_target:
                         raise AudioFetchError(
                             "Received redirect with no Location header"
@@ -208,23 +256,21 @@ class AudioResolver:
 
                         redirect_target = urljoin(current_uri, redirect_target)
                     current_uri = redirect_target
-                    response.close()
                     continue
 
-                response.raise_for_status()
+                # Release the pooled connection if the response is rejected
+                # before its body is consumed
+                try:
+                    response.raise_for_status()
 
-                content_length = response.headers.get("Content-Length")
-                if content_length:
-                    self._check_size(int(content_length))
-
-                chunks = []
-                downloaded = 0
-                for chunk in response.iter_content(chunk_size=1024 * 1024):
-                    downloaded += len(chunk)
-                    self._check_size(downloaded)
-                    chunks.append(chunk)
+                    content_length = response.headers.get("Content-Length")
+                    if content_length:
+                        self._check_size(int(content_length))
+                except BaseException:
+                    response.close()
+                    raise
 
-                return b"".join(chunks)
+                return self._download_to_tempfile(response)
 
             raise AudioFetchError(
                 f"Too many redirects (>{_MAX_REDIRECTS}) fetching audio URI"
@@ -236,6 +282,40 @@ class AudioResolver:
             logger.exception("Failed to fetch audio from URI")
             raise AudioFetchError(f"Failed to fetch audio URI: {exc}") from exc
 
+    def _download_to_tempfile(self, response: requests.Response) -> str:
+        """
+        Stream *response* into a named temporary file, enforcing the size
+        limit as bytes arrive.  The partial file is removed on failure.
+        """
+        tmp = tempfile.NamedTemporaryFile(prefix="stt-", suffix=".audio", delete=False)
+        try:
+            with tmp, response:
+                downloaded = 0
+                for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                    downloaded += len(chunk)
+                    self._check_size(downloaded)
+                    tmp.write(chunk)
+        except BaseException:
+            os.unlink(tmp.name)
+            raise
+
+        return tmp.name
+
+    @staticmethod
+    def cleanup(audio: str | bytes, source_type: str) -> None:
+        """
+        Remove the temporary file created when resolving a ``uri`` source.
+
+        No-op for ``path`` and ``data`` sources, which are never copied
+        to disk by the resolver.
+        """
+        if source_type != "uri" or not isinstance(audio, str):
+            return
+        try:
+            os.unlink(audio)
+        except FileNotFoundError:
+            pass
+
 
 class AudioPreprocessor:
     """
@@ -259,7 +339,9 @@ class AudioPreprocessor:
         """
         Decode encoded audio bytes to a 16 kHz mono float32 numpy array.
 
-        Uses ffmpeg to handle any input codec (mp3, ogg, wav, flac, …).
+        16-bit PCM WAV already at the target rate is decoded in-process;
+        everything else goes through ffmpeg, which handles any input
+        codec (mp3, ogg, wav, flac, …).
 
         Parameters:
             audio_bytes: Raw encoded audio data.
@@ -270,6 +352,10 @@ class AudioPreprocessor:
         Raises:
             AudioDecodeError: If ffmpeg exits with a non-zero status.
         """
+        pcm = self._decode_wav_pcm16(audio_bytes)
+        if pcm is not None:
+            return pcm
+
         cmd = [
             "ffmpeg",
             "-nostdin",
@@ -304,6 +390,43 @@ class AudioPreprocessor:
             np.frombuffer(process.stdout, dtype=np.int16).astype(np.float32) / 32768.0
         )
 
+    def _decode_wav_pcm16(self, audio_bytes: bytes) -> np.ndarray | None:
+        """
+        Decode 16-bit PCM WAV at the target sample rate without ffmpeg.
+
+        Multichannel audio is down-mixed by averaging channels.
+
+        Returns:
+            The float32 samples, or None when the payload is not a WAV
+            file this fast path can handle as-is.
+        """
+        if audio_bytes[:4] != b"RIFF" or audio_bytes[8:12] != b"WAVE":
+            return None
+
+        try:
+            with wave.open(io.BytesIO(audio_bytes)) as wav:
+                if wav.getsampwidth() != 2 or wav.getframerate() != self._sample_rate:
+                    return None
+                channels = wav.getnchannels()
+                frames = wav.readframes(wav.getnframes())
+        except (wave.Error, EOFError):
+            return None
+
+        # Streaming writers may leave the data chunk size at 0; ffmpeg
+        # decodes such files by reading to the end, so leave them to it
+        if not frames:
+            return None
+
+        # A file truncated mid-frame leaves a partial frame at the end; drop it
+        count = len(frames) // (2 * channels) * channels
+        samples = (
+            np.frombuffer(frames, dtype=np.int16, count=count).astype(np.float32)
+            / 32768.0
+        )
+        if channels > 1:
+            samples = samples.reshape(-1, channels).mean(axis=1)
+        return samples
+
     @staticmethod
     def to_bytesio(audio_bytes: bytes) -> io.BytesIO:
         """
@@ -1,20 +1,29 @@
+import logging
 import os
 import platform
-import subprocess
-import tomllib
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal, overload, cast, get_args
+from typing import Any, Callable, Literal, overload, cast, get_args
 
 Device = Literal["cuda", "cpu"]
 ComputeType = Literal["float16", "int8_float16", "int8", "float32"]
+# (config key, WHISPER_<SECTION>_<KEY> env var, default)
+_Field = tuple[str, str, Any]
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# platform.machine() spellings of ARM64 across Linux and macOS
+_ARM_SET = frozenset({"arm64", "aarch64", "arm64e"})
+
+
+@dataclass(slots=True, frozen=True)
 class ServiceConfig:
     socket_path: str
     log_level: str
     max_audio_size_mb: int
+    stream_batch_size: int
 
     @property
     def address(self) -> str:
@@ -29,7 +38,7 @@ class ServiceConfig:
         return True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelConfig:
     size: str
     download_dir: str
@@ -38,7 +47,7 @@ class ModelConfig:
     hf_token: str = field(repr=False)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InferenceConfig:
     beam_size: int
     vad_filter: bool
@@ -48,16 +57,19 @@ class InferenceConfig:
     compression_ratio_threshold: float
     word_timestamps: bool
     initial_prompt: str
+    batch_size: int  # 0 = sequential decoding
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConcurrencyConfig:
     max_workers: int
     cpu_threads: int
     num_workers: int
+    num_processes: int
+    max_concurrent_rpcs: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DiarizationConfig:
     """Configuration for the optional pyannote speaker-diarization pipeline."""
 
@@ -68,14 +80,14 @@ class DiarizationConfig:
     max_speakers: int  # 0 = auto
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddingsConfig:
     """Configuration for the text embeddings provider."""
 
     api_key: str = field(repr=False)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Settings:
     service: ServiceConfig
     model: ModelConfig
@@ -85,17 +97,18 @@ class Settings:
     embeddings: EmbeddingsConfig
 
 
+@lru_cache(maxsize=None)
 def _detect_arch() -> str:
     """
     Return the canonical CPU technical name, normalizing ARM variants to "arm64".
 
     Returns:
-        str: `"arm64"` for ARM architectures (`"arm64"` or `"aarch64"`), otherwise `"x86_64"`.
+        str: `"arm64"` for ARM architectures (any name in `_ARM_SET`), otherwise `"x86_64"`.
     """
-    arch = platform.machine().lower()
-    return "arm64" if arch in ("arm64", "aarch64") else "x86_64"
+    return "arm64" if platform.machine().lower() in _ARM_SET else "x86_64"
 
 
+@lru_cache(maxsize=None)
 def _detect_os() -> str:
     """
     Return the current operating system name in lowercase.
@@ -106,13 +119,56 @@ def _detect_os() -> str:
     return platform.system().lower()
 
 
+def _first_visible_gpu() -> str | None:
+    """
+    Return the GPU that CUDA will use as device 0.
+
+    This is the first entry of ``CUDA_VISIBLE_DEVICES`` (an index or a
+    UUID), or ``"0"`` when the variable is unset.
+
+    Returns:
+        str | None: The device identifier, or None when the variable hides
+        every GPU (empty, or a negative index such as ``-1``).
+    """
+    visible = os.environ.get("CUDA_VISIBLE_DEVICES")
+    if visible is None:
+        return "0"
+    first = visible.split(",")[0].strip()
+    if not first or first.startswith("-"):
+        return None
+    return first
+
+
+@lru_cache(maxsize=None)
 def _cuda_available() -> bool:
     """
-    Check whether CUDA is available to ctranslate2.
+    Check whether a CUDA device is available.
+
+    Asks NVML for a device count via ``pynvml`` when it is installed, which
+    is far cheaper than loading CTranslate2's native library. Only without
+    pynvml is ctranslate2 imported and queried instead. NVML ignores
+    ``CUDA_VISIBLE_DEVICES``, so a value hiding every GPU is checked first.
 
     Returns:
-        `true` if ctranslate2 reports CUDA compute type support, `false` otherwise.
+        `true` if at least one CUDA device is reported, `false` otherwise.
     """
+    if _first_visible_gpu() is None:
+        return False
+
+    try:
+        import pynvml
+    except ImportError:
+        pass
+    else:
+        try:
+            pynvml.nvmlInit()
+            try:
+                return pynvml.nvmlDeviceGetCount() > 0
+            finally:
+                pynvml.nvmlShutdown()
+        except Exception:
+            return False
+
     try:
         import ctranslate2
 
@@ -121,22 +177,30 @@ def _cuda_available() -> bool:
         return False
 
 
+@lru_cache(maxsize=None)
 def _physical_core_count() -> int:
     """
-    Return the number of physical CPU cores available on the system.
+    Return the number of physical CPU cores this process may run on.
 
-    Attempts to return the physical core count; if that cannot be determined,
-    returns the logical CPU count; if that is unavailable, returns 4.
+    On Linux the CPU affinity mask reflects cpusets applied by Docker or
+    Kubernetes, whereas psutil reports every core on the host. The smaller
+    of the two is used, so a pinned container is not oversubscribed and an
+    SMT host still counts physical rather than logical cores. Falls back to
+    the logical CPU count, then 4.
 
     Returns:
-        int: Number of CPU cores (physical if detectable, otherwise logical or 4).
+        int: Number of usable CPU cores.
     """
+    allowed = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else 0
     try:
         import psutil
 
-        return psutil.cpu_count(logical=False) or os.cpu_count() or 4
+        physical = psutil.cpu_count(logical=False) or 0
     except ImportError:
-        return os.cpu_count() or 4
+        physical = 0
+
+    counts = [n for n in (allowed, physical) if n]
+    return min(counts) if counts else os.cpu_count() or 4
 
 
 def _resolve_device(requested: str) -> Device:
@@ -154,19 +218,60 @@ def _resolve_device(requested: str) -> Device:
     if requested != "auto":
         return requested  # type: ignore
 
-    os_name = _detect_os()
-    arch = _detect_arch()
+    # Apple Silicon cannot have CUDA; skip the probe entirely
+    if _detect_os() == "darwin" and _detect_arch() == "arm64":
+        logger.info(
+            "Apple Silicon detected — using cpu (MPS not yet supported by CTranslate2)"
+        )
+        return "cpu"
 
     if _cuda_available():
         return "cuda"
 
-    if os_name == "darwin" and arch == "arm64":
-        print(
-            "[config] Apple Silicon detected — using cpu "
-            "(MPS not yet supported by CTranslate2)"
+    return "cpu"
+
+
+def _gpu_total_vram_mb() -> int:
+    """
+    Return the total memory, in MiB, of the GPU CUDA will use as device 0.
+
+    Both paths query the device chosen by `_first_visible_gpu`. NVML is
+    queried in-process via ``pynvml`` (from ``nvidia-ml-py``), which avoids
+    spawning ``nvidia-smi``; ``nvidia-smi`` is only used when pynvml is not
+    installed.
+
+    Raises:
+        Exception: If no GPU is visible or none can be queried.
+    """
+    device = _first_visible_gpu()
+    if device is None:
+        raise RuntimeError("CUDA_VISIBLE_DEVICES hides every GPU")
+
+    try:
+        import pynvml
+    except ImportError:
+        import subprocess
+
+        output = subprocess.check_output(
+            [
+                "nvidia-smi",
+                f"--id={device}",
+                "--query-gpu=memory.total",
+                "--format=csv,noheader,nounits",
+            ],
+            text=True,
         )
+        return int(output.strip())
 
-    return "cpu"
+    pynvml.nvmlInit()
+    try:
+        if device.isdigit():
+            handle = pynvml.nvmlDeviceGetHandleByIndex(int(device))
+        else:
+            handle = pynvml.nvmlDeviceGetHandleByUUID(device)
+        return int(pynvml.nvmlDeviceGetMemoryInfo(handle).total) // (1024 * 1024)
+    finally:
+        pynvml.nvmlShutdown()
 
 
 def _resolve_compute_type(requested: str, device: Device) -> ComputeType:
@@ -174,6 +279,12 @@ def _resolve_compute_type(requested: str, device: Device) -> ComputeType:
     Select an appropriate compute type based on the requested preference
     and target device.
 
+    Full-precision requests are upgraded to the quantized type for the
+    device: ``int8`` on CPU (VNNI/NEON int8 dot products, ~2-4x fp32
+    throughput) and ``int8_float16`` on CUDA (half the weight bandwidth
+    of fp16, which bounds the Whisper decoder). ``"default"`` is treated
+    like ``"auto"``.
+
     Parameters:
         requested (str): Desired compute type or `"auto"` to select one automatically.
         device (Device): Target device, either `"cuda"` or `"cpu"`.
@@ -181,7 +292,15 @@ def _resolve_compute_type(requested: str, device: Device) -> ComputeType:
     Returns:
         ComputeType: The resolved compute type.
     """
-    if requested != "auto":
+    if requested == "float32":
+        quantized: ComputeType = "int8_float16" if device == "cuda" else "int8"
+        logger.info(
+            "Upgrading float32 compute_type",
+            extra={"device": device, "compute_type": quantized},
+        )
+        return quantized
+
+    if requested not in ("auto", "default"):
         allowed_types = get_args(ComputeType)
 
         if requested not in allowed_types:
@@ -194,20 +313,13 @@ def _resolve_compute_type(requested: str, device: Device) -> ComputeType:
 
     if device == "cuda":
         try:
-            output = subprocess.check_output(
-                [
-                    "nvidia-smi",
-                    "--query-gpu=memory.total",
-                    "--format=csv,noheader,nounits",
-                ],
-                text=True,
-            ).strip()
-            vram_mb = int(output.split("\n")[0])
+            vram_mb = _gpu_total_vram_mb()
             if vram_mb >= 8000:
                 return "float16"
             else:
-                print(
-                    f"[config] VRAM={vram_mb}MB (<8GB) — using int8_float16 to save memory"
+                logger.info(
+                    "VRAM below 8GB — using int8_float16 to save memory",
+                    extra={"vram_mb": vram_mb},
                 )
                 return "int8_float16"
         except Exception:
@@ -216,24 +328,90 @@ def _resolve_compute_type(requested: str, device: Device) -> ComputeType:
     return "int8"
 
 
-def _resolve_cpu_threads(requested: int) -> int:
+def cpu_core_budget(num_processes: int = 1) -> int:
+    """
+    Return the number of CPU cores each server process sizes its threads from.
+
+    Both the auto `cpu_threads` value and the cap on the request worker
+    pool are derived from this, so they agree on the CPUs available.
+
+    Parameters:
+        num_processes (int): Server processes sharing the machine; the
+            usable cores are split evenly between them.
+
+    Returns:
+        int: Usable physical cores per process (see `_physical_core_count`),
+        at least 1.
+    """
+    return max(1, _physical_core_count() // max(1, num_processes))
+
+
+def _resolve_cpu_threads(requested: int, num_processes: int) -> int:
     """
     Choose the number of CPU threads to use.
 
     Parameters:
         requested (int): Number of threads requested; pass 0 to auto-select.
+        num_processes (int): Server processes sharing the CPU budget.
 
     Returns:
         int: The chosen number of CPU threads.
     """
     if requested != 0:
         return requested
-    cores = _physical_core_count()
+    cores = cpu_core_budget(num_processes)
     resolved = max(1, cores // 2)
-    print(f"[config] Detected {cores} physical cores → using {resolved} cpu_threads")
+    logger.info(
+        "Resolved cpu_threads from physical cores",
+        extra={"physical_cores": cores, "cpu_threads": resolved},
+    )
     return resolved
 
 
+def inference_workers(
+    max_workers: int, cpu_threads: int, num_processes: int, device: Device
+) -> int:
+    """
+    Number of threads that may run Whisper inference at once.
+
+    On CPU each inference thread drives `cpu_threads` CTranslate2 threads,
+    so the count is capped at the per-process core budget divided by
+    `cpu_threads`. On CUDA `cpu_threads` does not apply and `max_workers`
+    is used as configured.
+
+    Parameters:
+        max_workers (int): Resolved worker thread count.
+        cpu_threads (int): Resolved CTranslate2 threads per inference call.
+        num_processes (int): Server processes sharing the CPU budget.
+        device (Device): Resolved inference device.
+
+    Returns:
+        int: The inference thread count, at least 1.
+    """
+    if device != "cpu":
+        return max_workers
+    free_slots = cpu_core_budget(num_processes) // max(1, cpu_threads)
+    return max(1, min(max_workers, free_slots))
+
+
+def _resolve_max_concurrent_rpcs(requested: int, inference_threads: int) -> int:
+    """
+    Selects the cap on in-flight transcription RPCs before the server sheds
+    load. Embedding and rerank calls are not counted.
+
+    Parameters:
+        requested (int): If non-zero, used directly.
+        inference_threads (int): Size of the inference pool; the default
+            allows one queued transcription per inference thread.
+
+    Returns:
+        int: The chosen concurrent RPC limit.
+    """
+    if requested != 0:
+        return requested
+    return 2 * inference_threads
+
+
 def _resolve_max_workers(requested: int, device: Device) -> int:
     """
     Selects the maximum number of concurrent workers.
@@ -250,47 +428,128 @@ def _resolve_max_workers(requested: int, device: Device) -> int:
     return 1 if device == "cuda" else 2
 
 
+def _parse_bool(val: str) -> bool:
+    """Interpret an environment variable value as a boolean flag."""
+    return val.lower() in ("1", "true", "yes")
+
+
+# Environment values are cast to the exact type of the fallback. Keyed by
+# type rather than tested with isinstance, so bool never falls into int.
+_CASTERS: dict[type, Callable[[str], Any]] = {
+    bool: _parse_bool,
+    int: int,
+    float: float,
+    str: str,
+}
+
+
 @overload
-def _env(section: str, key: str, fallback: bool) -> bool: ...
+def _env(env_key: str, fallback: bool) -> bool: ...
 
 
 @overload
-def _env(section: str, key: str, fallback: int) -> int: ...
+def _env(env_key: str, fallback: int) -> int: ...
 
 
 @overload
-def _env(section: str, key: str, fallback: float) -> float: ...
+def _env(env_key: str, fallback: float) -> float: ...
 
 
 @overload
-def _env(section: str, key: str, fallback: str) -> str: ...
+def _env(env_key: str, fallback: str) -> str: ...
 
 
-def _env(
-    section: str, key: str, fallback: str | bool | int | float
-) -> str | bool | int | float:
+def _env(env_key: str, fallback: str | bool | int | float) -> str | bool | int | float:
     """
-    Read WHISPER_<SECTION>_<KEY> from environment, cast to type of fallback.
+    Read *env_key* from environment, cast to type of fallback.
 
     Parameters:
-        section (str): Section name for the env var prefix.
-        key (str): Key name for the env var suffix.
+        env_key (str): Full environment variable name.
         fallback: Default value whose type determines the cast.
 
     Returns:
         The environment variable value cast appropriately, or fallback.
     """
-    env_key = f"WHISPER_{section.upper()}_{key.upper()}"
     val = os.environ.get(env_key)
     if val is None:
         return fallback
-    if isinstance(fallback, bool):
-        return val.lower() in ("1", "true", "yes")
-    if isinstance(fallback, int):
-        return int(val)
-    if isinstance(fallback, float):
-        return float(val)
-    return val
+    return _CASTERS.get(type(fallback), str)(val)
+
+
+def _fields(section: str, *pairs: tuple[str, Any]) -> tuple[_Field, ...]:
+    """Build a section's field table, spelling out each env var name once."""
+    prefix = f"WHISPER_{section.upper()}_"
+    return tuple((key, prefix + key.upper(), default) for key, default in pairs)
+
+
+# Per-section (key, env var, default) fields, built at import. The default's
+# type is also the type the TOML value and any override are cast to.
+_SERVICE_FIELDS = _fields(
+    "service",
+    ("socket_path", "/tmp/whisper.sock"),
+    ("log_level", "info"),
+    ("max_audio_size_mb", 100),
+    ("stream_batch_size", 8),
+)
+_MODEL_FIELDS = _fields(
+    "model",
+    ("size", "large-v3"),
+    ("download_dir", "/var/lib/whisper/models"),
+    ("device", "auto"),
+    ("compute_type", "auto"),
+    ("hf_token", ""),
+)
+_INFERENCE_FIELDS = _fields(
+    "inference",
+    ("beam_size", 8),
+    ("vad_filter", True),
+    ("vad_min_silence_ms", 1000),
+    ("no_speech_threshold", 0.4),
+    ("log_prob_threshold", -0.3),
+    ("compression_ratio_threshold", 2.0),
+    ("word_timestamps", True),
+    ("initial_prompt", ""),
+    ("batch_size", 0),
+)
+_CONCURRENCY_FIELDS = _fields(
+    "concurrency",
+    ("max_workers", 0),
+    ("cpu_threads", 0),
+    ("num_workers", 1),
+    ("num_processes", 1),
+    ("max_concurrent_rpcs", 0),
+)
+_DIARIZATION_FIELDS = _fields(
+    "diarization",
+    ("enabled", True),
+    ("model", "pyannote/speaker-diarization-3.1"),
+    ("device", "auto"),
+    ("min_speakers", 0),
+    ("max_speakers", 0),
+)
+_EMBEDDINGS_FIELDS = _fields("embeddings", ("api_key", ""))
+
+
+def _load_section(
+    raw: dict[str, Any], section: str, fields: tuple[_Field, ...]
+) -> dict[str, Any]:
+    """
+    Read one config section, applying environment overrides.
+
+    Parameters:
+        raw (dict): Parsed TOML document.
+        section (str): Section name in the TOML document.
+        fields: The section's field table, as built by `_fields`.
+
+    Returns:
+        dict: Field values keyed by name, ready to pass to the section's
+        dataclass (after any resolution of ``auto`` values).
+    """
+    table = raw.get(section, {})
+    values: dict[str, Any] = {}
+    for key, env_key, default in fields:
+        values[key] = _env(env_key, type(default)(table.get(key, default)))
+    return values
 
 
 def load_settings(config_path: str | Path = "config.toml") -> Settings:
@@ -298,6 +557,11 @@ def load_settings(config_path: str | Path = "config.toml") -> Settings:
     Load application settings from a TOML configuration file, applying
     environment overrides and runtime-detected defaults.
 
+    The result is cached per resolved path, so repeated calls in a process
+    return the same Settings object without re-reading the file or
+    re-running hardware detection. Environment changes made after the first
+    call are not picked up.
+
     Parameters:
         config_path (str | Path): Path to the TOML configuration file.
 
@@ -307,122 +571,59 @@ def load_settings(config_path: str | Path = "config.toml") -> Settings:
     Raises:
         FileNotFoundError: If the specified configuration file does not exist.
     """
-    path = Path(config_path)
+    return _load_settings_cached(str(Path(config_path).resolve()))
+
+
+@lru_cache(maxsize=4)
+def _load_settings_cached(resolved_path: str) -> Settings:
+    """Uncached body of load_settings, keyed by the absolute config path."""
+    path = Path(resolved_path)
     if not path.exists():
         raise FileNotFoundError(f"Config file not found: {path.resolve()}")
 
-    with open(path, "rb") as f:
-        raw = tomllib.load(f)
+    import tomllib
+
+    raw = tomllib.loads(path.read_bytes().decode())
 
-    svc = raw.get("service", {})
-    mdl = raw.get("model", {})
-    inf = raw.get("inference", {})
-    con = raw.get("concurrency", {})
-    dia = raw.get("diarization", {})
-    emb = raw.get("embeddings", {})
+    svc = _load_section(raw, "service", _SERVICE_FIELDS)
+    mdl = _load_section(raw, "model", _MODEL_FIELDS)
+    inf = _load_section(raw, "inference", _INFERENCE_FIELDS)
+    con = _load_section(raw, "concurrency", _CONCURRENCY_FIELDS)
+    dia = _load_section(raw, "diarization", _DIARIZATION_FIELDS)
+    emb = _load_section(raw, "embeddings", _EMBEDDINGS_FIELDS)
 
     # --- Device + compute resolution ---
-    device = _resolve_device(_env("model", "device", str(mdl.get("device", "auto"))))
-    compute_type = _resolve_compute_type(
-        _env("model", "compute_type", str(mdl.get("compute_type", "auto"))),
-        device,
-    )
-    cpu_threads = _resolve_cpu_threads(
-        _env("concurrency", "cpu_threads", int(con.get("cpu_threads", 0)))
-    )
-    max_workers = _resolve_max_workers(
-        _env("concurrency", "max_workers", int(con.get("max_workers", 0))),
-        device,
+    device = _resolve_device(mdl["device"])
+    mdl["device"] = device
+    mdl["compute_type"] = _resolve_compute_type(mdl["compute_type"], device)
+    con["cpu_threads"] = _resolve_cpu_threads(con["cpu_threads"], con["num_processes"])
+    con["max_workers"] = _resolve_max_workers(con["max_workers"], device)
+    con["max_concurrent_rpcs"] = _resolve_max_concurrent_rpcs(
+        con["max_concurrent_rpcs"],
+        inference_workers(
+            con["max_workers"], con["cpu_threads"], con["num_processes"], device
+        ),
     )
 
     # --- Diarization device resolution ---
-    dia_device_raw = _env("diarization", "device", str(dia.get("device", "auto")))
-    dia_device = device if dia_device_raw == "auto" else _resolve_device(dia_device_raw)
+    if dia["device"] == "auto":
+        dia["device"] = device
+    else:
+        dia["device"] = _resolve_device(dia["device"])
 
     # --- Socket Path Strict Resolution ---
-    raw_socket = _env(
-        "service", "socket_path", str(svc.get("socket_path", "/tmp/whisper.sock"))
-    )
-    clean_socket_path = (
+    raw_socket = svc["socket_path"]
+    svc["socket_path"] = (
         raw_socket[len("unix://") :] if raw_socket.startswith("unix://") else raw_socket
     )
 
     settings = Settings(
-        service=ServiceConfig(
-            socket_path=clean_socket_path,
-            log_level=_env("service", "log_level", str(svc.get("log_level", "info"))),
-            max_audio_size_mb=_env(
-                "service", "max_audio_size_mb", int(svc.get("max_audio_size_mb", 100))
-            ),
-        ),
-        model=ModelConfig(
-            size=_env("model", "size", str(mdl.get("size", "large-v3"))),
-            download_dir=_env(
-                "model",
-                "download_dir",
-                str(mdl.get("download_dir", "/var/lib/whisper/models")),
-            ),
-            device=device,
-            compute_type=compute_type,
-            hf_token=_env("model", "hf_token", str(mdl.get("hf_token", ""))),
-        ),
-        inference=InferenceConfig(
-            beam_size=_env("inference", "beam_size", int(inf.get("beam_size", 8))),
-            vad_filter=_env(
-                "inference", "vad_filter", bool(inf.get("vad_filter", True))
-            ),
-            vad_min_silence_ms=_env(
-                "inference",
-                "vad_min_silence_ms",
-                int(inf.get("vad_min_silence_ms", 1000)),
-            ),
-            no_speech_threshold=_env(
-                "inference",
-                "no_speech_threshold",
-                float(inf.get("no_speech_threshold", 0.4)),
-            ),
-            log_prob_threshold=_env(
-                "inference",
-                "log_prob_threshold",
-                float(inf.get("log_prob_threshold", -0.3)),
-            ),
-            compression_ratio_threshold=_env(
-                "inference",
-                "compression_ratio_threshold",
-                float(inf.get("compression_ratio_threshold", 2.0)),
-            ),
-            word_timestamps=_env(
-                "inference", "word_timestamps", bool(inf.get("word_timestamps", True))
-            ),
-            initial_prompt=_env(
-                "inference", "initial_prompt", str(inf.get("initial_prompt", ""))
-            ),
-        ),
-        concurrency=ConcurrencyConfig(
-            max_workers=max_workers,
-            cpu_threads=cpu_threads,
-            num_workers=_env(
-                "concurrency", "num_workers", int(con.get("num_workers", 1))
-            ),
-        ),
-        diarization=DiarizationConfig(
-            enabled=_env("diarization", "enabled", bool(dia.get("enabled", True))),
-            model=_env(
-                "diarization",
-                "model",
-                str(dia.get("model", "pyannote/speaker-diarization-3.1")),
-            ),
-            device=dia_device,
-            min_speakers=_env(
-                "diarization", "min_speakers", int(dia.get("min_speakers", 0))
-            ),
-            max_speakers=_env(
-                "diarization", "max_speakers", int(dia.get("max_speakers", 0))
-            ),
-        ),
-        embeddings=EmbeddingsConfig(
-            api_key=_env("embeddings", "api_key", str(emb.get("api_key", "")))
-        ),
+        service=ServiceConfig(**svc),
+        model=ModelConfig(**mdl),
+        inference=InferenceConfig(**inf),
+        concurrency=ConcurrencyConfig(**con),
+        diarization=DiarizationConfig(**dia),
+        embeddings=EmbeddingsConfig(**emb),
     )
 
     hf_token = settings.model.hf_token
@@ -432,37 +633,42 @@ def load_settings(config_path: str | Path = "config.toml") -> Settings:
             from huggingface_hub import login
 
             login(token=hf_token)
-            print("[config] Successfully logged into Hugging Face Hub.")
+            logger.info("Successfully logged into Hugging Face Hub.")
         except ImportError:
-            print(
-                "[config] huggingface_hub not installed; relying on HF_TOKEN env var."
+            logger.warning(
+                "huggingface_hub not installed; relying on HF_TOKEN env var."
             )
         except Exception as exc:
-            print(
-                f"[config] Hugging Face login failed ({exc}); falling back to HF_TOKEN env var."
+            logger.warning(
+                "Hugging Face login failed; falling back to HF_TOKEN env var.",
+                extra={"error": str(exc)},
             )
 
-    _print_summary(settings)
     return settings
 
 
-def _print_summary(s: Settings):
+def print_summary(s: Settings):
     """Print a concise runtime summary of the provided Settings."""
-    print("─" * 50)
-    print(f"  OS/Arch        : {_detect_os()} / {_detect_arch()}")
-    print(f"  Device         : {s.model.device}")
-    print(f"  Compute type   : {s.model.compute_type}")
-    print(f"  Model          : {s.model.size}")
-    print(f"  HF Token       : {'<configured>' if s.model.hf_token else '<missing>'}")
-    print(
-        f"  Emb API Key    : {'<configured>' if s.embeddings.api_key else '<missing>'}"
-    )
-    print(f"  CPU threads    : {s.concurrency.cpu_threads}")
-    print(f"  Max workers    : {s.concurrency.max_workers}")
-    print(f"  Socket Path    : {s.service.socket_path}")
-    print(f"  Max Audio Size : {s.service.max_audio_size_mb}MB")
-    print(f"  Diarization    : {'enabled' if s.diarization.enabled else 'disabled'}")
+    configured = "<configured>"
+    lines = [
+        "─" * 50,
+        f"  OS/Arch        : {_detect_os()} / {_detect_arch()}",
+        f"  Device         : {s.model.device}",
+        f"  Compute type   : {s.model.compute_type}",
+        f"  Model          : {s.model.size}",
+        f"  HF Token       : {configured if s.model.hf_token else '<missing>'}",
+        f"  Emb API Key    : {configured if s.embeddings.api_key else '<missing>'}",
+        f"  CPU threads    : {s.concurrency.cpu_threads}",
+        f"  Max workers    : {s.concurrency.max_workers}",
+        f"  Max RPCs       : {s.concurrency.max_concurrent_rpcs}",
+        f"  Processes      : {s.concurrency.num_processes}",
+        f"  Socket Path    : {s.service.socket_path}",
+        f"  Max Audio Size : {s.service.max_audio_size_mb}MB",
+        f"  Diarization    : {'enabled' if s.diarization.enabled else 'disabled'}",
+    ]
     if s.diarization.enabled:
-        print(f"    Model        : {s.diarization.model}")
-        print(f"    Device       : {s.diarization.device}")
-    print("─" * 50)
+        lines.append(f"    Model        : {s.diarization.model}")
+        lines.append(f"    Device       : {s.diarization.device}")
+    lines.append("─" * 50)
+    # One write rather than a print per line
+    sys.stdout.write("\n".join(lines) + "\n")
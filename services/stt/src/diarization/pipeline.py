@@ -170,10 +170,11 @@ class DiarizationPipeline:
         if effective_min < 0 or effective_max < 0:
             raise ValueError("speakers must be >= 0")
 
-        logger.debug(
-            "Running diarization",
-            extra={"min_speakers": effective_min, "max_speakers": effective_max},
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Running diarization",
+                extra={"min_speakers": effective_min, "max_speakers": effective_max},
+            )
 
         result = self.pipeline(
             audio_input,
@@ -183,9 +184,10 @@ class DiarizationPipeline:
 
         annotation = self._extract_annotation(result)
 
-        logger.info(
-            "Diarization complete",
-            extra={"num_speakers": len(annotation.labels())},
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Diarization complete",
+                extra={"num_speakers": len(annotation.labels())},
+            )
 
         return DiarizationResult(annotation)
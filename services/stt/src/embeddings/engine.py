@@ -50,7 +50,7 @@ class EmbeddingsEngine:
         """
         Takes raw text inputs and returns domain embedding objects.
         """
-        logger.debug(f"Generating embeddings for {len(inputs)} items using {model}")
+        logger.debug("Generating embeddings for %d items using %s", len(inputs), model)
 
         try:
             if output_dimension is not None:
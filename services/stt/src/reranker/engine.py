@@ -56,7 +56,7 @@ class RerankerEngine:
         """
         effective_truncate = truncate if truncate is not None else self.DEFAULT_TRUNCATE
 
-        logger.debug(f"Reranking {len(documents)} documents using {model}")
+        logger.debug("Reranking %d documents using %s", len(documents), model)
 
         try:
             kwargs: dict[str, Any] = {
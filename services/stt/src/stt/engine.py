@@ -1,18 +1,27 @@
 import logging
 import threading
+import time
 from concurrent.futures import ThreadPoolExecutor, Future
-from typing import Any, Optional, Iterator
+from typing import TYPE_CHECKING, Any, Optional, Iterator
 
-from faster_whisper import WhisperModel
+import numpy as np
 
-from src.core.audio import AudioPreprocessor
+from src.core.audio import SAMPLE_RATE, AudioPreprocessor
 from src.core.settings import Settings
 from src.stt.domain import TranscriptChunkResult, WordSegment
 
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
+
 logger = logging.getLogger(__name__)
 
 INFERENCE_ERRORS = (RuntimeError, ValueError, OSError)
 
+# Loaded models keyed by their construction arguments, shared by every
+# TranscriptionEngine in the process so a model is only held in memory once.
+_MODEL_CACHE: dict[tuple, "WhisperModel"] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
 
 def _load_diarization():
     """
@@ -29,6 +38,68 @@ def _load_diarization():
         raise RuntimeError("Diarization dependencies are not installed.") from e
 
 
+def _load_whisper_model(settings: Settings) -> "WhisperModel":
+    """
+    Return the process-wide WhisperModel for *settings*, loading it once.
+
+    faster-whisper (and with it CTranslate2) is imported on first use, so
+    importing this module stays cheap. A freshly loaded model is warmed up
+    before it is cached.
+    """
+    key = (
+        settings.model.size,
+        settings.model.device,
+        settings.model.compute_type,
+        settings.model.download_dir,
+        settings.concurrency.num_workers,
+        settings.concurrency.cpu_threads,
+    )
+    with _MODEL_CACHE_LOCK:
+        model = _MODEL_CACHE.get(key)
+        if model is None:
+            from faster_whisper import WhisperModel
+
+            model = WhisperModel(
+                settings.model.size,
+                device=settings.model.device,
+                compute_type=settings.model.compute_type,
+                download_root=settings.model.download_dir,
+                num_workers=settings.concurrency.num_workers,
+                cpu_threads=settings.concurrency.cpu_threads,
+            )
+            _warm_up(model)
+            _MODEL_CACHE[key] = model
+        return model
+
+
+def _warm_up(model: "WhisperModel") -> None:
+    """
+    Run a throwaway decode over one second of silence.
+
+    CTranslate2 selects kernels and allocates its workspaces lazily on
+    the first call; doing it here keeps that cost off the first real
+    request. Failures are logged and otherwise ignored.
+    """
+    started = time.perf_counter()
+    try:
+        segments, _ = model.transcribe(
+            np.zeros(SAMPLE_RATE, dtype=np.float32),
+            beam_size=1,
+            vad_filter=False,
+        )
+        # Segments are produced lazily; drain them to force a decode
+        for _ in segments:
+            pass
+    except INFERENCE_ERRORS:
+        logger.warning("Whisper warm-up failed", exc_info=True)
+        return
+
+    logger.info(
+        "Whisper warm-up complete",
+        extra={"duration_ms": round((time.perf_counter() - started) * 1000)},
+    )
+
+
 class TranscriptionEngine:
     """
     Core business logic for Speech-to-Text and Diarization.
@@ -40,16 +111,35 @@ class TranscriptionEngine:
         self.inference = s.inference
         self._preprocessor = AudioPreprocessor()
 
-        # Initialize Whisper natively
-        self.model = WhisperModel(
-            s.model.size,
-            device=s.model.device,
-            compute_type=s.model.compute_type,
-            download_root=s.model.download_dir,
-            num_workers=s.concurrency.num_workers,
-            cpu_threads=s.concurrency.cpu_threads,
+        # Request-invariant decoding options, resolved once
+        inf = s.inference
+        self._default_prompt = inf.initial_prompt or None
+        self._base_transcribe_kwargs: dict[str, Any] = dict(
+            beam_size=inf.beam_size,
+            vad_filter=inf.vad_filter,
+            vad_parameters={"min_silence_duration_ms": inf.vad_min_silence_ms},
+            no_speech_threshold=inf.no_speech_threshold,
+            log_prob_threshold=inf.log_prob_threshold,
+            compression_ratio_threshold=inf.compression_ratio_threshold,
         )
 
+        # Initialize Whisper natively
+        self.model = _load_whisper_model(s)
+
+        # With batching enabled, the VAD-split chunks of each request are
+        # decoded together in batches of `batch_size` rather than one by one
+        self._transcriber: Any = self.model
+        if inf.batch_size > 0:
+            if inf.vad_filter:
+                from faster_whisper import BatchedInferencePipeline
+
+                self._transcriber = BatchedInferencePipeline(model=self.model)
+                self._base_transcribe_kwargs["batch_size"] = inf.batch_size
+            else:
+                logger.warning(
+                    "inference.batch_size requires vad_filter; decoding sequentially"
+                )
+
         self._diarization_config = s.diarization
         self.diarizer: Any = None
         self._diarizer_lock = threading.Lock()
@@ -69,8 +159,7 @@ class TranscriptionEngine:
         Executes the STT pipeline.
         Yields domain dataclasses representing streaming transcript chunks.
         """
-        inf = self.inference
-        prompt = initial_prompt or inf.initial_prompt or None
+        prompt = initial_prompt or self._default_prompt
 
         if diarize and not self._diarization_config.enabled:
             raise ValueError("Diarization requested but not enabled in config.")
@@ -103,20 +192,24 @@ class TranscriptionEngine:
 
         # ── Phase 2: Whisper ──────────────────────────
         # Whisper runs in the main thread concurrently with diarization
-        use_word_timestamps = inf.word_timestamps or diarize
-        segments, info = self.model.transcribe(
+        use_word_timestamps = self.inference.word_timestamps or diarize
+        segments, info = self._transcriber.transcribe(
             whisper_input,
             language=language,
-            beam_size=inf.beam_size,
-            vad_filter=inf.vad_filter,
-            vad_parameters={"min_silence_duration_ms": inf.vad_min_silence_ms},
             word_timestamps=use_word_timestamps,
             initial_prompt=prompt,
-            no_speech_threshold=inf.no_speech_threshold,
-            log_prob_threshold=inf.log_prob_threshold,
-            compression_ratio_threshold=inf.compression_ratio_threshold,
+            **self._base_transcribe_kwargs,
         )
 
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Transcription started",
+                extra={
+                    "language": info.language,
+                    "language_probability": round(info.language_probability, 2),
+                },
+            )
+
         # ── Phase 3: Wait & Merge ─────────────────────
         diarization_timeout_seconds = 60 * 60
         diarization = None
@@ -183,7 +276,7 @@ class TranscriptionEngine:
                 confidence=w.probability,
                 speaker_id=speaker_id,
             )
-            for w in (segment.words or [])
+            for w in (segment.words or ())
         ]
         return TranscriptChunkResult(
             start_time=segment.start,
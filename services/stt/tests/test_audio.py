@@ -0,0 +1,69 @@
+import io
+import wave
+
+import numpy as np
+import pytest
+
+from src.core.audio import SAMPLE_RATE, AudioPreprocessor
+
+
+def make_wav(samples: np.ndarray, channels: int = 1, rate: int = SAMPLE_RATE) -> bytes:
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(samples.astype(np.int16).tobytes())
+    return buf.getvalue()
+
+
+@pytest.fixture
+def no_ffmpeg(mocker):
+    """Fail the test if decoding falls through to the ffmpeg subprocess."""
+    return mocker.patch(
+        "src.core.audio.subprocess.run", side_effect=AssertionError("ffmpeg called")
+    )
+
+
+class TestWavFastPath:
+    def test_mono_pcm16_decoded_in_process(self, no_ffmpeg):
+        samples = np.array([0, 16384, -16384, 32767], dtype=np.int16)
+
+        result = AudioPreprocessor().decode_to_float32(make_wav(samples))
+
+        assert result.dtype == np.float32
+        np.testing.assert_allclose(result, samples / 32768.0)
+
+    def test_stereo_is_downmixed(self, no_ffmpeg):
+        # Interleaved L/R frames
+        samples = np.array([1000, 3000, -2000, 2000], dtype=np.int16)
+
+        result = AudioPreprocessor().decode_to_float32(make_wav(samples, channels=2))
+
+        np.testing.assert_allclose(result, np.array([2000, 0]) / 32768.0)
+
+    def test_truncated_stereo_wav_drops_partial_frame(self, no_ffmpeg):
+        samples = np.arange(200, dtype=np.int16)
+        audio = make_wav(samples, channels=2)[:-1]
+
+        result = AudioPreprocessor().decode_to_float32(audio)
+
+        # 100 frames written, the last one is incomplete
+        expected = samples[:198].reshape(-1, 2).mean(axis=1) / 32768.0
+        np.testing.assert_allclose(result, expected)
+
+    def test_zero_length_data_chunk_is_left_to_ffmpeg(self):
+        audio = bytearray(make_wav(np.arange(1000, dtype=np.int16)))
+        # Data chunk size as left by a streaming writer
+        size_offset = audio.index(b"data") + 4
+        audio[size_offset : size_offset + 4] = (0).to_bytes(4, "little")
+
+        assert AudioPreprocessor()._decode_wav_pcm16(bytes(audio)) is None
+
+    def test_other_sample_rate_is_left_to_ffmpeg(self):
+        audio = make_wav(np.zeros(10, dtype=np.int16), rate=44100)
+
+        assert AudioPreprocessor()._decode_wav_pcm16(audio) is None
+
+    def test_non_wav_is_left_to_ffmpeg(self):
+        assert AudioPreprocessor()._decode_wav_pcm16(b"ID3\x04not a wav") is None